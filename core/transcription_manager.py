@@ -31,6 +31,16 @@ class TranscriptionTask:
     error: Optional[str] = None
 
 
+@dataclass
+class TaskSnapshot:
+    """Display state of a task at the time of a status change"""
+    status: TranscriptionStatus
+    message: str
+    progress: float
+    queue_position: Optional[int]
+    filename: str
+
+
 class TranscriptionManager:
     """Manages sequential transcription queue (one at a time)"""
     
@@ -58,10 +68,23 @@ class TranscriptionManager:
         self.status_callbacks: List[Callable] = []
     
     def add_status_callback(self, callback: Callable):
-        """Add a callback for status updates"""
+        """
+        Add a callback for status updates
+        
+        The callback is called as callback(task_id, snapshot) with the changed
+        task's TaskSnapshot, or callback(None, None) when all tasks may have changed.
+        """
         if callback not in self.status_callbacks:
             self.status_callbacks.append(callback)
     
+    def shutdown(self):
+        """Save persistent caches before the application exits"""
+        self.transcriber.ffmpeg_manager.flush_cache()
+    
+    def prewarm(self):
+        """Start loading the Whisper model in the background, ahead of the first transcription"""
+        self.transcriber.whisper_manager.prewarm()
+    
     def add_transcription(self, file_path: str, filename: str) -> str:
         """
         Add a transcription to the queue
@@ -89,7 +112,7 @@ class TranscriptionManager:
             self.queue.append(task_id)
         
         self.logger.info(f"Added transcription task: {task_id} - {filename}")
-        self._notify_status_change()
+        self._notify_status_change(task_id)
         
         # Try to start processing if not already running
         self._process_queue()
@@ -109,6 +132,16 @@ class TranscriptionManager:
             # Get next task
             task_id = self.queue.pop(0)
             self.current_task_id = task_id
+            
+            # Every task still waiting moves up one position
+            moved = [
+                (queued_id, self._snapshot(self.tasks[queued_id], position))
+                for position, queued_id in enumerate(self.queue, start=1)
+                if queued_id in self.tasks
+            ]
+        
+        for queued_id, snapshot in moved:
+            self._notify_status_change(queued_id, snapshot)
         
         # Start transcription in separate thread
         thread = Thread(target=self._start_transcription, args=(task_id,), daemon=True)
@@ -128,7 +161,7 @@ class TranscriptionManager:
             task.message = "Starting transcription..."
         
         self.logger.info(f"Starting transcription: {task_id}")
-        self._notify_status_change()
+        self._notify_status_change(task_id)
         
         # Progress callback
         def progress_callback(percent: float, message: str):
@@ -138,7 +171,7 @@ class TranscriptionManager:
                     self.tasks[task_id].progress = percent
                     self.tasks[task_id].message = message
             # Notify AFTER releasing lock
-            self._notify_status_change()
+            self._notify_status_change(task_id)
         
         # Completion callback
         def completion_callback(success: bool, text: str, message: str):
@@ -161,7 +194,7 @@ class TranscriptionManager:
             
             # Log, notify, and process queue AFTER releasing lock
             self.logger.info(f"Transcription {'completed' if success else 'failed'}: {task_id}")
-            self._notify_status_change()
+            self._notify_status_change(task_id)
             self._process_queue()
         
         # Start transcription
@@ -188,6 +221,25 @@ class TranscriptionManager:
                 return self.queue.index(task_id) + 1
             return None
     
+    def get_all_snapshots(self) -> Dict[str, TaskSnapshot]:
+        """Get snapshots of all tasks in order"""
+        with self.lock:
+            positions = {task_id: i for i, task_id in enumerate(self.queue, start=1)}
+            return {
+                task_id: self._snapshot(self.tasks[task_id], positions.get(task_id))
+                for task_id in self.task_order if task_id in self.tasks
+            }
+    
+    def _snapshot(self, task: TranscriptionTask, queue_position: Optional[int]) -> TaskSnapshot:
+        """Build a snapshot of a task (caller must hold the lock)"""
+        return TaskSnapshot(
+            status=task.status,
+            message=task.message,
+            progress=task.progress,
+            queue_position=queue_position,
+            filename=task.filename
+        )
+    
     def get_summary(self) -> Dict:
         """Get summary statistics"""
         with self.lock:
@@ -222,10 +274,26 @@ class TranscriptionManager:
         self.logger.info(f"Cleared {len(to_remove)} completed tasks")
         self._notify_status_change()
     
-    def _notify_status_change(self):
-        """Notify all status callbacks of changes"""
+    def _notify_status_change(self, task_id: Optional[str] = None, snapshot: Optional[TaskSnapshot] = None):
+        """
+        Notify all status callbacks of changes
+        
+        Args:
+            task_id: ID of the task that changed, or None if all tasks may have changed
+            snapshot: Snapshot of the task, built here if not given
+        """
+        if task_id is not None and snapshot is None:
+            with self.lock:
+                task = self.tasks.get(task_id)
+                if task is None:
+                    return
+                queue_position = None
+                if task.status == TranscriptionStatus.QUEUED and task_id in self.queue:
+                    queue_position = self.queue.index(task_id) + 1
+                snapshot = self._snapshot(task, queue_position)
+        
         for callback in self.status_callbacks:
             try:
-                callback()
+                callback(task_id, snapshot)
             except Exception as e:
                 self.logger.error(f"Error in status callback: {e}")
@@ -15,6 +15,7 @@ from ui.synthesis_tab import SynthesisTab
 from core.transcription_manager import TranscriptionManager
 from utils.logger import setup_logger
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 
 # Fix for PyInstaller --noconsole: redirect stdout/stderr to avoid crashes
 if sys.stdout is None:
@@ -121,6 +122,9 @@ class VideoSynthesisApp(ctk.CTk):
         # Create shared transcription manager
         self.transcription_manager = TranscriptionManager(self.logger)
         
+        # Worker for writing transcription exports off the UI thread
+        self.export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+        
         # Initialize tab contents
         self.settings_tab = SettingsTab(
             self.tabview.tab("Settings"),
@@ -143,6 +147,7 @@ class VideoSynthesisApp(ctk.CTk):
         self.transcription_results_tab = TranscriptionResultsTab(
             self.tabview.tab("Transcription Results"),
             self.transcription_manager,
+            self.export_executor,
             self.logger
         )
         
@@ -202,6 +207,9 @@ class VideoSynthesisApp(ctk.CTk):
     def on_closing(self):
         """Handle application closing"""
         self.logger.info("Application closed")
+        self.transcription_manager.shutdown()
+        # Drop queued exports; one already being written still finishes before exit
+        self.export_executor.shutdown(wait=False, cancel_futures=True)
         self.destroy()
 
 
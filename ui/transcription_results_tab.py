@@ -7,9 +7,10 @@ from ui.widgets import TranscriptionResultCard
 
 
 class TranscriptionResultsTab:
-    def __init__(self, parent, transcription_manager, logger):
+    def __init__(self, parent, transcription_manager, export_executor, logger):
         self.parent = parent
         self.transcription_manager = transcription_manager
+        self.export_executor = export_executor
         self.logger = logger
         
         # Store result cards
@@ -82,8 +83,12 @@ class TranscriptionResultsTab:
         # Initial check for existing results
         self.update_results_display()
     
-    def update_results_display(self):
+    def update_results_display(self, task_id=None, snapshot=None):
         """Update the results display (called from transcription manager)"""
+        # Only finished transcriptions (or a full refresh) affect the results
+        if snapshot is not None and snapshot.status.value != 'done':
+            return
+        
         # This needs to run on the main thread
         try:
             self.parent.after(0, self._update_results_display_impl)
@@ -120,7 +125,8 @@ class TranscriptionResultsTab:
             card = TranscriptionResultCard(
                 self.results_container,
                 task.filename,
-                task.text
+                task.text,
+                self.export_executor
             )
             
             # Add to grid
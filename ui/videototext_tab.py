@@ -3,9 +3,9 @@ Video to Text Tab - Transcribe multiple audio/video files using Whisper
 """
 
 import customtkinter as ctk
-import time
+from threading import Lock
 from tkinter import messagebox
-from ui.widgets import FileInputList, StatusLog
+from ui.widgets import FileInputList, StatusLog, get_fonts
 
 
 class VideoToTextTab:
@@ -14,6 +14,16 @@ class VideoToTextTab:
         self.transcription_manager = transcription_manager
         self.logger = logger
         
+        # Latest snapshot of each task changed since the last repaint, whether a
+        # full rescan is needed, and whether a repaint is already scheduled
+        self._dirty_lock = Lock()
+        self._dirty_snapshots = {}
+        self._full_refresh = True
+        self._pending_flush = False
+        
+        # File count currently shown on the transcribe button
+        self._last_btn_count = None
+        
         # Set callback for status updates
         self.transcription_manager.add_status_callback(self.update_status_display)
         
@@ -21,6 +31,7 @@ class VideoToTextTab:
     
     def setup_ui(self):
         """Create the Video to Text tab UI"""
+        fonts = get_fonts()
         
         # Main container
         container = ctk.CTkFrame(self.parent, fg_color="transparent")
@@ -34,7 +45,7 @@ class VideoToTextTab:
         title_label = ctk.CTkLabel(
             container,
             text="Video to Text Transcription",
-            font=("Arial", 20, "bold")
+            font=fonts['title']
         )
         title_label.grid(row=0, column=0, sticky="w", pady=(0, 20))
         
@@ -43,7 +54,12 @@ class VideoToTextTab:
         file_frame.grid(row=1, column=0, sticky="ew", pady=(0, 10))
         
         # File Input List Widget
-        self.file_list = FileInputList(file_frame, fg_color="transparent")
+        self.file_list = FileInputList(
+            file_frame,
+            on_change=self.update_transcribe_button,
+            on_file_selected=self.transcription_manager.prewarm,
+            fg_color="transparent"
+        )
         self.file_list.pack(fill="x", padx=20, pady=15)
         
         # Transcribe Button
@@ -52,7 +68,7 @@ class VideoToTextTab:
             text="Transcribe All Files",
             height=45,
             corner_radius=10,
-            font=("Arial", 14, "bold"),
+            font=fonts['heading'],
             command=self.start_transcriptions
         )
         self.transcribe_btn.grid(row=2, column=0, sticky="ew", pady=15)
@@ -69,7 +85,7 @@ class VideoToTextTab:
         info_label = ctk.CTkLabel(
             action_frame,
             text="💡 Completed transcriptions appear in the 'Transcription Results' tab",
-            font=("Arial", 11),
+            font=fonts['body'],
             text_color="gray50"
         )
         info_label.pack(side="left")
@@ -140,61 +156,86 @@ class VideoToTextTab:
             f"Added {len(files)} file(s) to the transcription queue.\n\nResults will appear in the 'Transcription Results' tab as they complete."
         )
     
-    def update_status_display(self):
+    def update_status_display(self, task_id=None, snapshot=None):
         """Update the status log display (called from transcription manager)"""
-        # Rate limit UI updates
-        now = time.time()
-        if hasattr(self, '_last_update') and now - self._last_update < 0.1:
-            return
-        self._last_update = now
+        # Record what changed; the actual repaint happens on the main thread.
+        # Only the first change since the last repaint schedules one, so bursts
+        # of updates collapse into at most one repaint every 50 ms.
+        with self._dirty_lock:
+            if task_id is None or snapshot is None:
+                self._full_refresh = True
+            else:
+                self._dirty_snapshots[task_id] = snapshot
+            
+            if self._pending_flush:
+                return
+            self._pending_flush = True
         
-        # This needs to run on the main thread
         try:
-            self.parent.after(0, self._update_status_display_impl)
-        except:
-            pass
+            self.parent.after(50, self._flush_if_pending)
+        except Exception:
+            # Nothing was scheduled, so let the next update try again
+            with self._dirty_lock:
+                self._pending_flush = False
+            raise
+    
+    def _flush_if_pending(self):
+        """Run the scheduled status repaint"""
+        with self._dirty_lock:
+            if not self._pending_flush:
+                return
+            self._pending_flush = False
+        
+        self._update_status_display_impl()
     
     def _update_status_display_impl(self):
         """Implementation of status display update"""
         try:
-            # Get all tasks
-            tasks = self.transcription_manager.get_all_tasks()
+            # Take the pending changes
+            with self._dirty_lock:
+                full_refresh = self._full_refresh
+                snapshots = self._dirty_snapshots
+                self._full_refresh = False
+                self._dirty_snapshots = {}
             
-            # Update each task in the log
-            for task in tasks:
-                # Get queue position if queued
-                queue_pos = self.transcription_manager.get_queue_position(task.id)
-                message = task.message
-                if queue_pos:
-                    message = f"Queued (position {queue_pos})"
+            if full_refresh:
+                snapshots = self.transcription_manager.get_all_snapshots()
+            
+            # Apply the changes to the log (redrawn once at the end of the block)
+            with self.status_log.batched():
+                if full_refresh:
+                    # Drop tasks the manager no longer has (e.g. cleared ones)
+                    for task_id in list(self.status_log.tasks):
+                        if task_id not in snapshots:
+                            self.status_log.remove_task(task_id)
                 
-                self.status_log.update_task(
-                    task.id,
-                    task.status.value,
-                    message,
-                    name=task.filename,
-                    progress=task.progress
-                )
+                for task_id, snapshot in snapshots.items():
+                    message = snapshot.message
+                    if snapshot.queue_position:
+                        message = f"Queued (position {snapshot.queue_position})"
+                    
+                    self.status_log.update_task(
+                        task_id,
+                        snapshot.status.value,
+                        message,
+                        name=snapshot.filename,
+                        progress=snapshot.progress
+                    )
             
             # Update summary
             summary = self.transcription_manager.get_summary()
             self.status_log.set_summary_from_stats(summary)
             
-            # Update button
-            self.update_transcribe_button()
-            
-            # Force UI update to show changes immediately
-            try:
-                self.parent.update_idletasks()
-            except:
-                pass
-            
         except Exception as e:
             self.logger.error(f"Error updating status display: {e}")
     
     def update_transcribe_button(self):
         """Update transcribe button text based on file count"""
         file_count = self.file_list.get_count()
+        if file_count == self._last_btn_count:
+            return
+        self._last_btn_count = file_count
+        
         if file_count == 0:
             self.transcribe_btn.configure(text="Transcribe All Files")
         elif file_count == 1:
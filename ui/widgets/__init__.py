@@ -2,6 +2,7 @@
 UI Widgets Package
 """
 
+from .fonts import get_fonts
 from .url_input_list import URLInputList
 from .file_input_list import FileInputList
 from .status_log import StatusLog
@@ -11,5 +12,6 @@ __all__ = [
     'URLInputList',
     'FileInputList',
     'StatusLog',
-    'TranscriptionResultCard'
+    'TranscriptionResultCard',
+    'get_fonts'
 ]
@@ -5,16 +5,30 @@ File Input List Widget - Dynamic list of file input fields
 import customtkinter as ctk
 from tkinter import filedialog
 import os
+import uuid
+from .fonts import get_fonts
+
+
+_MEDIA_FILETYPES = (
+    ("Media files", "*.mp3 *.mp4 *.wav *.m4a *.avi *.mkv *.flac"),
+    ("All files", "*.*")
+)
 
 
 class FileInputList(ctk.CTkFrame):
     """Widget for managing a dynamic list of file inputs"""
     
-    def __init__(self, parent, **kwargs):
+    # Directory of the last browsed file, shared by all lists
+    _last_dir = None
+    
+    def __init__(self, parent, on_change=None, on_file_selected=None, **kwargs):
         super().__init__(parent, **kwargs)
+        fonts = get_fonts()
         
-        self.file_entries = []
+        self._entries = {}  # {entry_id: entry_data}, in display order
         self.max_files = 20
+        self.on_change = None  # Set once the initial field exists
+        self.on_file_selected = on_file_selected  # Called when a field gets an existing file
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -27,7 +41,7 @@ class FileInputList(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame,
             text="Select Audio/Video Files:",
-            font=("Arial", 14, "bold")
+            font=fonts['heading']
         )
         title_label.grid(row=0, column=0, sticky="w")
         
@@ -48,13 +62,17 @@ class FileInputList(ctk.CTkFrame):
         
         # Add initial field
         self.add_file_field()
+        
+        self.on_change = on_change
     
     def add_file_field(self):
         """Add a new file input field"""
-        if len(self.file_entries) >= self.max_files:
+        if len(self._entries) >= self.max_files:
             return
         
-        row = len(self.file_entries)
+        fonts = get_fonts()
+        row = len(self._entries)
+        entry_id = str(uuid.uuid4())
         
         # Create frame for this file field
         field_frame = ctk.CTkFrame(self.fields_container, fg_color="transparent")
@@ -67,7 +85,7 @@ class FileInputList(ctk.CTkFrame):
             placeholder_text="No file selected...",
             height=35,
             corner_radius=8,
-            font=("Arial", 11)
+            font=fonts['body']
         )
         file_entry.grid(row=0, column=0, sticky="ew", padx=(0, 10))
         
@@ -78,7 +96,7 @@ class FileInputList(ctk.CTkFrame):
             width=80,
             height=35,
             corner_radius=8,
-            command=lambda idx=row: self.browse_file(idx)
+            command=lambda eid=entry_id: self.browse_file_by_id(eid)
         )
         browse_btn.grid(row=0, column=1, padx=(0, 10))
         
@@ -91,79 +109,169 @@ class FileInputList(ctk.CTkFrame):
             corner_radius=8,
             fg_color="#d32f2f",
             hover_color="#b71c1c",
-            command=lambda: self.remove_file_field(row)
+            command=lambda eid=entry_id: self.remove_file_field_by_id(eid)
         )
         delete_btn.grid(row=0, column=2)
         
         # Store references
-        self.file_entries.append({
+        entry_data = {
+            'id': entry_id,
             'frame': field_frame,
             'entry': file_entry,
             'browse_btn': browse_btn,
             'delete_btn': delete_btn,
-            'file_path': None
-        })
+            'file_path': None,
+            'checked_text': None  # Entry text at the time of the last validation
+        }
+        self._entries[entry_id] = entry_data
+        
+        # Validate typed paths when the user leaves the field
+        file_entry.bind("<FocusOut>", lambda e: self._on_entry_focus_out(entry_data))
+        file_entry.bind("<KeyRelease>", lambda e: self._notify_change())
         
         # Update delete button visibility
         self._update_delete_buttons()
+        self._notify_change()
     
-    def browse_file(self, index):
-        """Open file browser for a specific field"""
-        filetypes = [
-            ("Media files", "*.mp3 *.mp4 *.wav *.m4a *.avi *.mkv *.flac"),
-            ("All files", "*.*")
-        ]
+    def browse_file_by_id(self, entry_id):
+        """Open file browser for the field with the given ID"""
+        entry_data = self._entries.get(entry_id)
+        if entry_data is None:
+            return
         
         filename = filedialog.askopenfilename(
             title="Select Audio/Video File",
-            filetypes=filetypes
+            filetypes=_MEDIA_FILETYPES,
+            initialdir=FileInputList._last_dir
         )
         
         if filename:
             # Normalize path
             filename = os.path.normpath(filename)
+            FileInputList._last_dir = os.path.dirname(filename)
             
             # Update entry
-            self.file_entries[index]['entry'].delete(0, 'end')
-            self.file_entries[index]['entry'].insert(0, filename)
-            self.file_entries[index]['file_path'] = filename
+            entry_data['entry'].delete(0, 'end')
+            entry_data['entry'].insert(0, filename)
+            
+            # A file picked from the dialog is known to exist
+            self._set_validation(entry_data, filename, True)
+            self._notify_change()
+            self._notify_file_selected()
     
-    def remove_file_field(self, index):
-        """Remove a file input field"""
-        if len(self.file_entries) <= 1:
+    def remove_file_field_by_id(self, entry_id):
+        """Remove the file input field with the given ID"""
+        if len(self._entries) <= 1 or entry_id not in self._entries:
             return
         
-        # Destroy the frame
-        self.file_entries[index]['frame'].destroy()
-        
-        # Remove from list
-        del self.file_entries[index]
+        # Remove from dict and destroy the frame
+        self._entries.pop(entry_id)['frame'].destroy()
         
-        # Re-grid remaining fields
-        for i, entry_data in enumerate(self.file_entries):
+        # Re-grid remaining fields (button commands are bound by ID, so they stay valid)
+        for i, entry_data in enumerate(self._entries.values()):
             entry_data['frame'].grid(row=i, column=0, sticky="ew", pady=5)
-            # Update button commands
-            entry_data['browse_btn'].configure(command=lambda idx=i: self.browse_file(idx))
-            entry_data['delete_btn'].configure(command=lambda idx=i: self.remove_file_field(idx))
         
         # Update delete button visibility
         self._update_delete_buttons()
+        self._notify_change()
+    
+    def _on_entry_focus_out(self, entry_data):
+        """Validate a field when it loses focus"""
+        if self._validate_entry(entry_data):
+            self._notify_file_selected()
+        self._notify_change()
+    
+    def _notify_file_selected(self):
+        """Tell the owner that a field now points to an existing file"""
+        if self.on_file_selected:
+            self.on_file_selected()
+    
+    def _notify_change(self):
+        """Tell the owner that the set of selected files may have changed"""
+        if self.on_change:
+            self.on_change()
     
     def _update_delete_buttons(self):
         """Update visibility of delete buttons"""
-        show_delete = len(self.file_entries) > 1
-        for entry_data in self.file_entries:
+        show_delete = len(self._entries) > 1
+        for entry_data in self._entries.values():
             if show_delete:
                 entry_data['delete_btn'].grid()
             else:
                 entry_data['delete_btn'].grid_remove()
     
+    def _collect_entries(self):
+        """Get the raw (stripped) text of every file field"""
+        return [entry_data['entry'].get().strip() for entry_data in self._entries.values()]
+    
+    def _validate_entry(self, entry_data, text=None):
+        """
+        Check that a field points to an existing file, caching the result
+        
+        The file system is only hit when the text changed since the last check.
+        """
+        if text is None:
+            text = entry_data['entry'].get().strip()
+        
+        if text != entry_data['checked_text']:
+            self._set_validation(entry_data, text, bool(text) and os.path.exists(text))
+        
+        return entry_data['file_path']
+    
+    def _set_validation(self, entry_data, text, exists):
+        """Store the validation result for a field"""
+        entry_data['checked_text'] = text
+        entry_data['file_path'] = text if exists else None
+    
+    def _paths_exist(self, paths):
+        """
+        Check which paths exist, listing each shared parent directory only once
+        
+        Args:
+            paths: List of file paths
+            
+        Returns:
+            dict: {path: bool}
+        """
+        by_dir = {}
+        for path in paths:
+            by_dir.setdefault(os.path.dirname(path) or '.', []).append(path)
+        
+        results = {}
+        for dirname, dir_paths in by_dir.items():
+            if len(dir_paths) > 1:
+                # One directory listing answers for every file in it
+                try:
+                    with os.scandir(dirname) as it:
+                        names = {os.path.normcase(entry.name) for entry in it}
+                except OSError:
+                    names = None
+                
+                if names is not None:
+                    # A name missing from the listing may still exist under another spelling
+                    # (case-insensitive or Unicode-normalizing file systems), so confirm misses
+                    for path in dir_paths:
+                        results[path] = os.path.normcase(os.path.basename(path)) in names or os.path.exists(path)
+                    continue
+            
+            for path in dir_paths:
+                results[path] = os.path.exists(path)
+        
+        return results
+    
     def get_files(self):
         """Get list of selected file paths with filenames"""
+        texts = self._collect_entries()
+        
+        # Re-check every field on submit: a file validated earlier may have been deleted since
+        exists = self._paths_exist([text for text in texts if text])
+        for entry_data, text in zip(self._entries.values(), texts):
+            self._set_validation(entry_data, text, exists.get(text, False))
+        
         files = []
-        for entry_data in self.file_entries:
-            file_path = entry_data['entry'].get().strip()
-            if file_path and os.path.exists(file_path):
+        for entry_data in self._entries.values():
+            file_path = entry_data['file_path']
+            if file_path:
                 filename = os.path.basename(file_path)
                 files.append({
                     'path': file_path,
@@ -173,10 +281,12 @@ class FileInputList(ctk.CTkFrame):
     
     def clear_all(self):
         """Clear all file fields"""
-        for entry_data in self.file_entries:
+        for entry_data in self._entries.values():
             entry_data['entry'].delete(0, 'end')
             entry_data['file_path'] = None
+            entry_data['checked_text'] = None
+        self._notify_change()
     
     def get_count(self):
-        """Get number of selected files"""
-        return len(self.get_files())
+        """Get number of non-empty file fields (no file system access)"""
+        return sum(1 for text in self._collect_entries() if text)
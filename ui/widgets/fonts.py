@@ -0,0 +1,28 @@
+"""
+Fonts - Shared CTkFont objects for the widgets
+"""
+
+import customtkinter as ctk
+
+
+_fonts = None
+
+
+def get_fonts():
+    """
+    Get the shared fonts, creating them on first call
+    
+    Must be called after the root CTk window exists.
+    
+    Returns:
+        dict: Font name -> CTkFont ('title', 'heading', 'subheading', 'body')
+    """
+    global _fonts
+    if _fonts is None:
+        _fonts = {
+            'title': ctk.CTkFont(family="Arial", size=20, weight="bold"),
+            'heading': ctk.CTkFont(family="Arial", size=14, weight="bold"),
+            'subheading': ctk.CTkFont(family="Arial", size=13, weight="bold"),
+            'body': ctk.CTkFont(family="Arial", size=11)
+        }
+    return _fonts
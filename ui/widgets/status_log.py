@@ -2,7 +2,9 @@
 Status Log Widget - Real-time status display for tasks
 """
 
+import contextlib
 import customtkinter as ctk
+from .fonts import get_fonts
 
 
 class StatusLog(ctk.CTkFrame):
@@ -25,10 +27,21 @@ class StatusLog(ctk.CTkFrame):
         'failed': '#f44336'
     }
     
+    # Precomputed line prefixes and statuses that show a percentage
+    _PREFIX = {status: f"{icon} " for status, icon in STATUS_ICONS.items()}
+    _PROGRESS_STATUSES = frozenset({'downloading', 'transcribing'})
+    
     def __init__(self, parent, title="Status:", **kwargs):
         super().__init__(parent, corner_radius=10, **kwargs)
+        fonts = get_fonts()
         
-        self.task_labels = {}  # {task_id: label_widget}
+        self.tasks = {}  # {task_id: (status, status_text, color)}, in insertion order
+        self._last_summary = "No tasks"
+        self._color_tags = set()
+        self._rendered = []  # [(status_text, color)] currently shown, one per line
+        self._flush_pending = False
+        self._dirty = False
+        self._batching = False
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -37,24 +50,26 @@ class StatusLog(ctk.CTkFrame):
         header_label = ctk.CTkLabel(
             self,
             text=title,
-            font=("Arial", 14, "bold")
+            font=fonts['heading']
         )
         header_label.grid(row=0, column=0, sticky="w", padx=20, pady=(15, 5))
         
-        # Scrollable frame for status entries
-        self.scroll_frame = ctk.CTkScrollableFrame(
+        # Single read-only textbox holding one line per task
+        self.text = ctk.CTkTextbox(
             self,
             height=200,
-            fg_color="transparent"
+            font=fonts['body'],
+            fg_color="transparent",
+            wrap="none",
+            state="disabled"
         )
-        self.scroll_frame.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 10))
-        self.scroll_frame.grid_columnconfigure(0, weight=1)
+        self.text.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 10))
         
         # Summary label
         self.summary_label = ctk.CTkLabel(
             self,
             text="No tasks",
-            font=("Arial", 11),
+            font=fonts['body'],
             text_color="gray"
         )
         self.summary_label.grid(row=2, column=0, sticky="w", padx=20, pady=(0, 15))
@@ -73,54 +88,98 @@ class StatusLog(ctk.CTkFrame):
             name: Optional task name/filename
             progress: Optional progress percentage (0-100)
         """
-        icon = self.STATUS_ICONS.get(status, '⚪')
         color = self.STATUS_COLORS.get(status, 'gray')
         
         # Build status text
-        if name:
-            status_text = f"{icon} {name} - {message}"
-        else:
-            status_text = f"{icon} {message}"
+        prefix = self._PREFIX.get(status, '⚪ ')
+        status_text = prefix + (name + ' - ' + message if name else message)
         
         # Add progress if available
-        if progress is not None and status in ['downloading', 'transcribing']:
+        if progress is not None and status in self._PROGRESS_STATUSES:
             status_text += f" ({progress:.0f}%)"
         
-        # Create or update label
-        if task_id not in self.task_labels:
-            label = ctk.CTkLabel(
-                self.scroll_frame,
-                text=status_text,
-                font=("Arial", 11),
-                text_color=color,
-                anchor="w"
-            )
-            row = len(self.task_labels)
-            label.grid(row=row, column=0, sticky="ew", pady=2)
-            self.task_labels[task_id] = label
-        else:
-            self.task_labels[task_id].configure(text=status_text, text_color=color)
+        entry = (status, status_text, color)
+        if self.tasks.get(task_id) != entry:
+            self.tasks[task_id] = entry
+            self._schedule_flush()
     
     def remove_task(self, task_id):
         """Remove a task from the log"""
-        if task_id in self.task_labels:
-            self.task_labels[task_id].destroy()
-            del self.task_labels[task_id]
-            
-            # Re-grid remaining labels
-            for i, label in enumerate(self.task_labels.values()):
-                label.grid(row=i, column=0, sticky="ew", pady=2)
+        if task_id in self.tasks:
+            del self.tasks[task_id]
+            self._schedule_flush()
     
     def clear_all(self):
         """Clear all tasks"""
-        for label in self.task_labels.values():
-            label.destroy()
-        self.task_labels.clear()
+        self.tasks.clear()
+        self._schedule_flush()
         self.update_summary("No tasks")
     
+    @contextlib.contextmanager
+    def batched(self):
+        """
+        Group several task updates into a single redraw
+        
+        Redrawing is deferred until the block exits, then done once.
+        """
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            self._flush()
+    
+    def _schedule_flush(self):
+        """Coalesce pending task changes into a single redraw on idle"""
+        self._dirty = True
+        if not self._batching and not self._flush_pending:
+            self._flush_pending = True
+            self.after_idle(self._flush)
+    
+    def _flush(self):
+        """Rewrite only the textbox lines whose text or color changed"""
+        self._flush_pending = False
+        if not self._dirty:
+            return
+        self._dirty = False
+        
+        lines = [(status_text, color) for _, status_text, color in self.tasks.values()]
+        rendered = self._rendered
+        
+        # Edits above the viewport can still shift it, so pin the scroll offset
+        first = self.text.yview()[0]
+        self.text.configure(state="normal")
+        
+        for i, (line, old_line) in enumerate(zip(lines, rendered), start=1):
+            if line != old_line:
+                self.text.delete(f"{i}.0", f"{i}.end")
+                self.text.insert(f"{i}.0", line[0], self._color_tag(line[1]))
+        
+        if len(lines) > len(rendered):
+            for i, (status_text, color) in enumerate(lines[len(rendered):], start=len(rendered)):
+                text = "\n" + status_text if i else status_text
+                self.text.insert("end-1c", text, self._color_tag(color))
+        elif len(lines) < len(rendered):
+            start = f"{len(lines)}.end" if lines else "1.0"
+            self.text.delete(start, "end-1c")
+        
+        self.text.configure(state="disabled")
+        self.text.yview_moveto(first)
+        self._rendered = lines
+    
+    def _color_tag(self, color):
+        """Return the text tag for a color, configuring it on first use"""
+        if color not in self._color_tags:
+            self.text.tag_config(color, foreground=color)
+            self._color_tags.add(color)
+        return color
+    
     def update_summary(self, summary_text):
         """Update the summary label"""
+        if summary_text == self._last_summary:
+            return
         self.summary_label.configure(text=summary_text)
+        self._last_summary = summary_text
     
     def set_summary_from_stats(self, stats):
         """
@@ -3,18 +3,32 @@ Transcription Result Card Widget - Display individual transcription result
 """
 
 import customtkinter as ctk
-from tkinter import messagebox, filedialog
+from tkinter import messagebox, filedialog, TclError
 import os
+import importlib.util
+from .fonts import get_fonts
+
+
+# python-docx is optional and heavy to import (lxml), so only check that it exists here
+_DOCX_AVAILABLE = importlib.util.find_spec('docx') is not None
+
+_EXPORT_FILETYPES = (
+    ("Text files", "*.txt"),
+    ("Word documents", "*.docx")
+)
 
 
 class TranscriptionResultCard(ctk.CTkFrame):
     """Widget for displaying a single transcription result"""
     
-    def __init__(self, parent, filename, text, **kwargs):
+    def __init__(self, parent, filename, text, export_executor, **kwargs):
         super().__init__(parent, corner_radius=10, **kwargs)
+        fonts = get_fonts()
         
         self.filename = filename
         self.text = text
+        self.export_executor = export_executor  # App-owned worker for writing exports
+        self._copy_status_job = None
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -28,13 +42,22 @@ class TranscriptionResultCard(ctk.CTkFrame):
         filename_label = ctk.CTkLabel(
             header_frame,
             text=f"📄 {filename}",
-            font=("Arial", 13, "bold"),
+            font=fonts['subheading'],
             anchor="w"
         )
         filename_label.grid(row=0, column=0, sticky="w")
         
+        # Transient feedback for the copy button
+        self.copy_status_label = ctk.CTkLabel(
+            header_frame,
+            text="",
+            font=fonts['body'],
+            text_color="#4CAF50"
+        )
+        self.copy_status_label.grid(row=0, column=1, padx=(0, 10))
+        
         # Export button
-        export_btn = ctk.CTkButton(
+        self.export_btn = ctk.CTkButton(
             header_frame,
             text="Export",
             width=80,
@@ -42,7 +65,7 @@ class TranscriptionResultCard(ctk.CTkFrame):
             corner_radius=6,
             command=self.export_text
         )
-        export_btn.grid(row=0, column=1, padx=(0, 10))
+        self.export_btn.grid(row=0, column=2, padx=(0, 10))
         
         # Copy button
         copy_btn = ctk.CTkButton(
@@ -53,12 +76,12 @@ class TranscriptionResultCard(ctk.CTkFrame):
             corner_radius=6,
             command=self.copy_text
         )
-        copy_btn.grid(row=0, column=2)
+        copy_btn.grid(row=0, column=3)
         
         # Text display (read-only)
         self.text_box = ctk.CTkTextbox(
             self,
-            font=("Arial", 11),
+            font=fonts['body'],
             corner_radius=8,
             wrap="word",
             height=150
@@ -75,18 +98,24 @@ class TranscriptionResultCard(ctk.CTkFrame):
         try:
             self.clipboard_clear()
             self.clipboard_append(self.text)
-            messagebox.showinfo("Copied", "Text copied to clipboard!")
+            # Some platforms only keep the clipboard content after an update
+            self.update()
+            
+            # Show a short inline confirmation instead of a modal dialog
+            self.copy_status_label.configure(text="Copied!")
+            if self._copy_status_job is not None:
+                self.after_cancel(self._copy_status_job)
+            self._copy_status_job = self.after(1500, self._clear_copy_status)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to copy text: {str(e)}")
     
+    def _clear_copy_status(self):
+        """Hide the copy confirmation"""
+        self._copy_status_job = None
+        self.copy_status_label.configure(text="")
+    
     def export_text(self):
         """Export text to .txt or .docx file"""
-        # Ask for file type
-        file_types = [
-            ("Text files", "*.txt"),
-            ("Word documents", "*.docx")
-        ]
-        
         # Suggest filename based on original
         base_name = os.path.splitext(self.filename)[0]
         default_name = f"{base_name}_transcription.txt"
@@ -94,49 +123,76 @@ class TranscriptionResultCard(ctk.CTkFrame):
         filepath = filedialog.asksaveasfilename(
             title="Export Transcription",
             defaultextension=".txt",
-            filetypes=file_types,
+            filetypes=_EXPORT_FILETYPES,
             initialfile=default_name
         )
         
         if not filepath:
             return
         
+        # Determine file type
+        ext = os.path.splitext(filepath)[1].lower()
+        if ext not in ('.txt', '.docx'):
+            messagebox.showerror("Error", "Unsupported file format")
+            return
+        
+        # Write the file on a worker thread and report back on the main thread
+        self.export_btn.configure(state="disabled")
+        future = self.export_executor.submit(self._write_export, filepath, ext)
+        future.add_done_callback(self._schedule_export_done)
+    
+    def _schedule_export_done(self, future):
+        """Hand a finished export back to the main thread (runs on the worker thread)"""
         try:
-            # Determine file type
-            ext = os.path.splitext(filepath)[1].lower()
-            
-            if ext == '.txt':
-                # Export as plain text
-                with open(filepath, 'w', encoding='utf-8') as f:
+            self.after(0, lambda: self._on_export_done(future))
+        except (RuntimeError, TclError):
+            pass  # The window was closed while the export was running
+    
+    def _write_export(self, filepath, ext):
+        """
+        Write the transcription to disk (runs on a worker thread)
+        
+        Returns:
+            tuple: (saved_path: str, docx_missing: bool)
+        """
+        if ext == '.docx':
+            if not _DOCX_AVAILABLE:
+                # Fallback to txt
+                txt_path = filepath.replace('.docx', '.txt')
+                with open(txt_path, 'w', encoding='utf-8') as f:
                     f.write(self.text)
-                messagebox.showinfo("Export Successful", f"Transcription saved to:\n{filepath}")
+                return (txt_path, True)
             
-            elif ext == '.docx':
-                # Export as Word document
-                try:
-                    from docx import Document
-                    
-                    doc = Document()
-                    doc.add_heading(f'Transcription: {self.filename}', 0)
-                    doc.add_paragraph(self.text)
-                    doc.save(filepath)
-                    
-                    messagebox.showinfo("Export Successful", f"Transcription saved to:\n{filepath}")
-                except ImportError:
-                    messagebox.showerror(
-                        "Missing Dependency",
-                        "python-docx is required for .docx export.\n\n"
-                        "Install it with: pip install python-docx\n\n"
-                        "Falling back to .txt export..."
-                    )
-                    # Fallback to txt
-                    txt_path = filepath.replace('.docx', '.txt')
-                    with open(txt_path, 'w', encoding='utf-8') as f:
-                        f.write(self.text)
-                    messagebox.showinfo("Export Successful", f"Transcription saved to:\n{txt_path}")
+            # Export as Word document
+            from docx import Document
             
-            else:
-                messagebox.showerror("Error", "Unsupported file format")
+            doc = Document()
+            doc.add_heading(f'Transcription: {self.filename}', 0)
+            doc.add_paragraph(self.text)
+            doc.save(filepath)
+            return (filepath, False)
+        
+        # Export as plain text
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(self.text)
+        return (filepath, False)
+    
+    def _on_export_done(self, future):
+        """Report the export result (runs on the main thread)"""
+        self.export_btn.configure(state="normal")
         
+        try:
+            saved_path, docx_missing = future.result()
         except Exception as e:
             messagebox.showerror("Export Failed", f"Failed to export transcription:\n{str(e)}")
+            return
+        
+        if docx_missing:
+            messagebox.showerror(
+                "Missing Dependency",
+                "python-docx is required for .docx export.\n\n"
+                "Install it with: pip install python-docx\n\n"
+                "Falling back to .txt export..."
+            )
+        
+        messagebox.showinfo("Export Successful", f"Transcription saved to:\n{saved_path}")
@@ -3,6 +3,8 @@ URL Input List Widget - Dynamic list of URL input fields
 """
 
 import customtkinter as ctk
+import uuid
+from .fonts import get_fonts
 
 
 class URLInputList(ctk.CTkFrame):
@@ -10,8 +12,9 @@ class URLInputList(ctk.CTkFrame):
     
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
+        fonts = get_fonts()
         
-        self.url_entries = []
+        self._entries = {}  # {entry_id: entry_data}, in display order
         self.max_urls = 20
         
         # Configure grid
@@ -25,7 +28,7 @@ class URLInputList(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame,
             text="Video URLs:",
-            font=("Arial", 14, "bold")
+            font=fonts['heading']
         )
         title_label.grid(row=0, column=0, sticky="w")
         
@@ -49,10 +52,12 @@ class URLInputList(ctk.CTkFrame):
     
     def add_url_field(self):
         """Add a new URL input field"""
-        if len(self.url_entries) >= self.max_urls:
+        if len(self._entries) >= self.max_urls:
             return
         
-        row = len(self.url_entries)
+        fonts = get_fonts()
+        row = len(self._entries)
+        entry_id = str(uuid.uuid4())
         
         # Create frame for this URL field
         field_frame = ctk.CTkFrame(self.fields_container, fg_color="transparent")
@@ -65,7 +70,7 @@ class URLInputList(ctk.CTkFrame):
             placeholder_text="https://www.youtube.com/watch?v=...",
             height=35,
             corner_radius=8,
-            font=("Arial", 11)
+            font=fonts['body']
         )
         url_entry.grid(row=0, column=0, sticky="ew", padx=(0, 10))
         
@@ -78,44 +83,41 @@ class URLInputList(ctk.CTkFrame):
             corner_radius=8,
             fg_color="#d32f2f",
             hover_color="#b71c1c",
-            command=lambda: self.remove_url_field(row)
+            command=lambda eid=entry_id: self.remove_url_field_by_id(eid)
         )
         delete_btn.grid(row=0, column=1)
         
         # Store references
-        self.url_entries.append({
+        entry_data = {
+            'id': entry_id,
             'frame': field_frame,
             'entry': url_entry,
             'delete_btn': delete_btn
-        })
+        }
+        self._entries[entry_id] = entry_data
         
         # Update delete button visibility
         self._update_delete_buttons()
     
-    def remove_url_field(self, index):
-        """Remove a URL input field"""
-        if len(self.url_entries) <= 1:
+    def remove_url_field_by_id(self, entry_id):
+        """Remove the URL input field with the given ID"""
+        if len(self._entries) <= 1 or entry_id not in self._entries:
             return
         
-        # Destroy the frame
-        self.url_entries[index]['frame'].destroy()
+        # Remove from dict and destroy the frame
+        self._entries.pop(entry_id)['frame'].destroy()
         
-        # Remove from list
-        del self.url_entries[index]
-        
-        # Re-grid remaining fields
-        for i, entry_data in enumerate(self.url_entries):
+        # Re-grid remaining fields (delete commands are bound by ID, so they stay valid)
+        for i, entry_data in enumerate(self._entries.values()):
             entry_data['frame'].grid(row=i, column=0, sticky="ew", pady=5)
-            # Update delete button command
-            entry_data['delete_btn'].configure(command=lambda idx=i: self.remove_url_field(idx))
         
         # Update delete button visibility
         self._update_delete_buttons()
     
     def _update_delete_buttons(self):
         """Update visibility of delete buttons"""
-        show_delete = len(self.url_entries) > 1
-        for entry_data in self.url_entries:
+        show_delete = len(self._entries) > 1
+        for entry_data in self._entries.values():
             if show_delete:
                 entry_data['delete_btn'].grid()
             else:
@@ -124,7 +126,7 @@ class URLInputList(ctk.CTkFrame):
     def get_urls(self):
         """Get list of non-empty URLs"""
         urls = []
-        for entry_data in self.url_entries:
+        for entry_data in self._entries.values():
             url = entry_data['entry'].get().strip()
             if url:
                 urls.append(url)
@@ -132,7 +134,7 @@ class URLInputList(ctk.CTkFrame):
     
     def clear_all(self):
         """Clear all URL fields"""
-        for entry_data in self.url_entries:
+        for entry_data in self._entries.values():
             entry_data['entry'].delete(0, 'end')
     
     def get_count(self):
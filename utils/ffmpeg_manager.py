@@ -4,15 +4,96 @@ FFmpeg Manager - Download and manage FFmpeg executable
 
 import os
 import sys
+import json
+import hashlib
 import platform
-import requests
-import zipfile
+import re
 import stat
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from threading import Thread
+from threading import Thread, Lock
+
+
+# Download tuning: bytes per read, and number of parallel range requests
+_CHUNK_SIZE = 1024 * 1024
+_DOWNLOAD_PARTS = 8
+
+# Minimum seconds between download progress reports
+_PROGRESS_INTERVAL = 0.1
+
+# (connect, read) timeouts in seconds for download requests, so a stalled server is retried
+_REQUEST_TIMEOUT = (10, 60)
+
+# Attempts per download before giving up (resuming where the last one stopped)
+_MAX_ATTEMPTS = 5
+
+# Downloaded archives larger than this are spooled to a temporary file instead of memory
+_SPOOL_MAX_SIZE = 256 * 1024 * 1024
+
+# Maximum number of remembered media durations
+_DURATION_CACHE_SIZE = 1024
+
+# Number of new durations after which the on-disk cache is rewritten
+_DURATION_FLUSH_EVERY = 16
+
+# "Duration: HH:MM:SS.ss" line printed by ffmpeg -i
+_DURATION_RE = re.compile(r"Duration:\s(\d+):(\d+):(\d+\.\d+)")
+
+# Maximum bytes of ffmpeg stderr read while looking for the Duration line
+_DURATION_READ_LIMIT = 64 * 1024
+
+
+# HTTP session shared by all downloads so connections (and TLS handshakes) are reused
+_session = None
+_session_lock = Lock()
+
+
+def _get_session():
+    """Get the shared requests session, creating it on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            # One pooled connection per parallel range; failed connects are retried with backoff
+            adapter = HTTPAdapter(
+                pool_connections=_DOWNLOAD_PARTS,
+                pool_maxsize=_DOWNLOAD_PARTS,
+                max_retries=Retry(total=3, backoff_factor=1)
+            )
+            _session = requests.Session()
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+        return _session
+
+
+def _retry_errors():
+    """Network errors after which a download is resumed (requests is imported lazily)"""
+    import requests
+    return (
+        requests.exceptions.ChunkedEncodingError,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout
+    )
 
 
 class FFmpegManager:
+    # Install state shared by all instances (they manage the same files).
+    # None means "not checked yet"; updated by download() and uninstall().
+    _installed = None
+    
+    # Bundled FFmpeg path when running frozen ('' if none), None until checked
+    _resolved_path = None
+    
+    # Serializes writes of the shared duration cache file across instances and threads
+    _cache_write_lock = Lock()
+    
     def __init__(self, logger):
         self.logger = logger
         
@@ -23,42 +104,62 @@ class FFmpegManager:
         if system == 'Windows':
             self.ffmpeg_dir = Path(os.getenv('APPDATA', os.path.expanduser('~'))) / 'VideoSynthesis'
             self.ffmpeg_path = self.ffmpeg_dir / 'ffmpeg.exe'
+            self.ffprobe_path = self.ffmpeg_dir / 'ffprobe.exe'
             self.download_url = "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip"
+            self.checksum_url = "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/checksums.sha256"
         elif system == 'Darwin':  # macOS
             self.ffmpeg_dir = Path.home() / '.VideoSynthesis'
             self.ffmpeg_path = self.ffmpeg_dir / 'ffmpeg'
+            self.ffprobe_path = self.ffmpeg_dir / 'ffprobe'
             self.download_url = "https://evermeet.cx/ffmpeg/get/zip"
+            self.checksum_url = None  # Evermeet publishes no checksum list
         else:  # Linux
             self.ffmpeg_dir = Path.home() / '.VideoSynthesis'
             self.ffmpeg_path = self.ffmpeg_dir / 'ffmpeg'
+            self.ffprobe_path = self.ffmpeg_dir / 'ffprobe'
             # Default to a generic static build source if needed, otherwise leave as Windows URL as placeholder or handle Linux specifically
             self.download_url = "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-linux64-gpl.tar.xz"
+            self.checksum_url = "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/checksums.sha256"
         
         self.ffmpeg_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Probed durations: {(path, mtime_ns, size): seconds}, least recently used first.
+        # Persisted to disk so files seen in earlier sessions are not probed again.
+        self._duration_cache = OrderedDict()
+        self._duration_lock = Lock()
+        self._duration_unsaved = 0
+        self._cache_path = self.ffmpeg_dir / 'duration_cache.json'
+        self._load_duration_cache()
     
     def is_installed(self):
-        """Check if FFmpeg is installed"""
-        installed = self.ffmpeg_path.exists()
-        self.logger.debug(f"FFmpeg installed: {installed}")
-        return installed
+        """Check if FFmpeg is installed (cached after the first check)"""
+        if FFmpegManager._installed is None:
+            FFmpegManager._installed = self.ffmpeg_path.exists()
+            self.logger.debug(f"FFmpeg installed: {FFmpegManager._installed}")
+        return FFmpegManager._installed
     
     def get_path(self):
         """Get FFmpeg executable path"""
         if getattr(sys, 'frozen', False):
             # Running as compiled executable
-            # Check if FFmpeg is bundled
-            base_path = sys._MEIPASS
-            ffmpeg_exe = 'ffmpeg.exe' if platform.system() == 'Windows' else 'ffmpeg'
-            bundled_ffmpeg = Path(base_path) / ffmpeg_exe
-            if bundled_ffmpeg.exists():
-                return str(bundled_ffmpeg)
+            # Check (once) if FFmpeg is bundled
+            if FFmpegManager._resolved_path is None:
+                base_path = sys._MEIPASS
+                ffmpeg_exe = 'ffmpeg.exe' if platform.system() == 'Windows' else 'ffmpeg'
+                bundled_ffmpeg = Path(base_path) / ffmpeg_exe
+                FFmpegManager._resolved_path = str(bundled_ffmpeg) if bundled_ffmpeg.exists() else ''
+            
+            if FFmpegManager._resolved_path:
+                return FFmpegManager._resolved_path
         
         # Return downloaded FFmpeg path
         return str(self.ffmpeg_path) if self.is_installed() else None
     
     def get_audio_duration(self, file_path):
         """
-        Get duration of audio/video file in seconds using ffmpeg
+        Get duration of audio/video file in seconds using ffprobe (or ffmpeg as a fallback)
+        
+        Results are cached per file version (path, modification time and size).
         
         Args:
             file_path: Path to media file
@@ -66,27 +167,115 @@ class FFmpegManager:
         Returns:
             float: Duration in seconds, or 0.0 if failed
         """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return self._probe_duration(file_path)
+        
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        with self._duration_lock:
+            if key in self._duration_cache:
+                self._duration_cache.move_to_end(key)
+                return self._duration_cache[key]
+        
+        duration = self._probe_duration(file_path)
+        
+        # Failed probes are not cached so they can be retried
+        if duration > 0:
+            with self._duration_lock:
+                self._duration_cache[key] = duration
+                if len(self._duration_cache) > _DURATION_CACHE_SIZE:
+                    self._duration_cache.popitem(last=False)
+                self._duration_unsaved += 1
+                should_flush = self._duration_unsaved >= _DURATION_FLUSH_EVERY
+            
+            if should_flush:
+                self.flush_cache()
+        
+        return duration
+    
+    def _load_duration_cache(self):
+        """Load durations saved by a previous session"""
+        try:
+            entries = json.loads(self._cache_path.read_text(encoding='utf-8'))
+            for path, mtime_ns, size, duration in entries[-_DURATION_CACHE_SIZE:]:
+                self._duration_cache[(path, mtime_ns, size)] = duration
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable duration cache: {e}")
+    
+    def flush_cache(self):
+        """Save the duration cache to disk (call at shutdown)"""
+        with self._duration_lock:
+            if not self._duration_unsaved:
+                return
+            entries = [[path, mtime_ns, size, duration] for (path, mtime_ns, size), duration in self._duration_cache.items()]
+            self._duration_unsaved = 0
+        
+        try:
+            # Write to a temporary file and swap it in so a crash never leaves a truncated cache
+            with FFmpegManager._cache_write_lock:
+                tmp_path = self._cache_path.with_suffix('.tmp')
+                tmp_path.write_text(json.dumps(entries), encoding='utf-8')
+                os.replace(tmp_path, self._cache_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to save duration cache: {e}")
+    
+    def _probe_duration(self, file_path):
+        """Run ffprobe/ffmpeg to get the duration of a media file (0.0 if failed)"""
         import subprocess
-        import re
         
         ffmpeg_path = self.get_path()
         if not ffmpeg_path:
             return 0.0
-            
+        
+        # On Windows, hide the console window
+        startupinfo = None
+        if os.name == 'nt':
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        
+        # Prefer ffprobe (shipped next to ffmpeg in most builds): it prints the bare duration
+        ffmpeg_dir, ffmpeg_name = os.path.split(ffmpeg_path)
+        ffprobe_path = os.path.join(ffmpeg_dir, ffmpeg_name.replace('ffmpeg', 'ffprobe'))
+        if os.path.exists(ffprobe_path):
+            try:
+                cmd = [ffprobe_path, '-v', 'error', '-show_entries', 'format=duration', '-of', 'csv=p=0', file_path]
+                result = subprocess.run(cmd, capture_output=True, text=True, startupinfo=startupinfo)
+                duration = float(result.stdout.strip())
+                self.logger.debug(f"File duration: {duration}s - {file_path}")
+                return duration
+            except Exception as e:
+                self.logger.warning(f"ffprobe failed for {file_path}, falling back to ffmpeg: {e}")
+        
         try:
             # Use ffmpeg -i to get info (faster than full scan)
             # We use subprocess.PIPE to capture stderr where ffmpeg puts metadata info
             cmd = [ffmpeg_path, '-i', file_path]
-            # On Windows, hide the console window
-            startupinfo = None
-            if os.name == 'nt':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                
-            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='ignore', startupinfo=startupinfo)
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, startupinfo=startupinfo)
+            
+            # Look for Duration: 00:00:00.00, which is printed in the first metadata block.
+            # Stop reading (and stop ffmpeg) as soon as it appears.
+            buf = bytearray()
+            match = None
+            try:
+                while len(buf) < _DURATION_READ_LIMIT:
+                    chunk = proc.stderr.read1(4096)
+                    if not chunk:
+                        break
+                    buf += chunk
+                    if b'Duration:' in buf:
+                        match = _DURATION_RE.search(buf.decode('ascii', 'ignore'))
+                        if match:
+                            break
+            finally:
+                # ffmpeg only reads headers here, so kill it outright: unlike terminate() plus a
+                # bounded wait, this cannot time out and lose a Duration already found
+                proc.kill()
+                proc.wait()
+                proc.stderr.close()
             
-            # Look for Duration: 00:00:00.00
-            match = re.search(r"Duration:\s(\d+):(\d+):(\d+\.\d+)", result.stderr)
             if match:
                 hours = int(match.group(1))
                 minutes = int(match.group(2))
@@ -110,69 +299,114 @@ class FFmpegManager:
         """
         def _download():
             try:
+                # Imported here so startup does not pay for modules only needed to install FFmpeg
+                import tarfile
+                import zipfile
+                import requests
+                
                 self.logger.info(f"Starting FFmpeg download from {self.download_url}")
                 
                 # Download zip file
                 if progress_callback:
                     progress_callback(0, "Connecting to server...")
                 
-                response = requests.get(self.download_url, stream=True)
-                response.raise_for_status()
+                expected_sha256 = self._fetch_checksum()
                 
-                total_size = int(response.headers.get('content-length', 0))
-                zip_path = self.ffmpeg_dir / 'ffmpeg.zip'
+                # Ask for size and range support first (following redirects to the CDN).
+                # Some servers reject HEAD, so a failure only rules out the parallel download.
+                try:
+                    head = _get_session().head(self.download_url, allow_redirects=True, timeout=_REQUEST_TIMEOUT)
+                    head.raise_for_status()
+                    total_size = int(head.headers.get('content-length', 0))
+                    accepts_ranges = head.headers.get('accept-ranges', '').lower() == 'bytes'
+                except requests.RequestException as e:
+                    self.logger.warning(f"HEAD request failed ({e}), downloading over a single connection")
+                    total_size = 0
+                    accepts_ranges = False
                 
+                # Progress is shared by all download threads
                 downloaded = 0
-                chunk_size = 8192
+                downloaded_lock = Lock()
+                last_report = 0.0
+                total_mb = total_size // 1024 // 1024
                 
-                with open(zip_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        if chunk:
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            
-                            if progress_callback and total_size > 0:
-                                percent = int((downloaded / total_size) * 80)  # Reserve 20% for extraction
-                                progress_callback(percent, f"Downloading... {downloaded // 1024 // 1024}MB / {total_size // 1024 // 1024}MB")
+                def on_chunk(size):
+                    nonlocal downloaded, last_report
+                    with downloaded_lock:
+                        downloaded += size
+                        current = downloaded
+                        
+                        # Report at most every _PROGRESS_INTERVAL seconds, plus once at the end
+                        now = time.monotonic()
+                        if now - last_report < _PROGRESS_INTERVAL and current < total_size:
+                            return
+                        last_report = now
+                    
+                    if progress_callback and total_size > 0:
+                        percent = int((current / total_size) * 80)  # Reserve 20% for extraction
+                        progress_callback(percent, f"Downloading... {current // 1024 // 1024}MB / {total_mb}MB")
                 
-                self.logger.info("Download complete. Extracting...")
+                def on_restart():
+                    nonlocal downloaded
+                    with downloaded_lock:
+                        downloaded = 0
                 
-                if progress_callback:
-                    progress_callback(85, "Extracting FFmpeg...")
-                
-                # Extract ffmpeg from zip based on OS structure
-                system = platform.system()
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    if system == 'Windows':
-                        # Find ffmpeg.exe in the archive (usually in bin/ folder)
-                        for file_info in zip_ref.filelist:
-                            if file_info.filename.endswith('bin/ffmpeg.exe'):
-                                with zip_ref.open(file_info) as source:
-                                    with open(self.ffmpeg_path, 'wb') as target:
-                                        target.write(source.read())
-                                break
-                    elif system == 'Darwin':
-                        # Evermeet zip usually contains just 'ffmpeg' at the root
-                        for file_info in zip_ref.filelist:
-                            if file_info.filename == 'ffmpeg' or file_info.filename.endswith('/ffmpeg'):
-                                with zip_ref.open(file_info) as source:
-                                    with open(self.ffmpeg_path, 'wb') as target:
-                                        target.write(source.read())
-                                # Make executable on macOS/Linux
-                                os.chmod(self.ffmpeg_path, os.stat(self.ffmpeg_path).st_mode | stat.S_IEXEC)
-                                break
+                # The archive is kept in memory (spilling to a temporary file only if very
+                # large) and extracted from there, so no ffmpeg.zip is written and re-read
+                with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as archive:
+                    if accepts_ranges and total_size > 0:
+                        self._download_parallel(head.url, total_size, archive, on_chunk)
+                        # Ranges arrive out of order, so hash the assembled archive
+                        sha256 = self._hash_file(archive) if expected_sha256 else None
+                    else:
+                        sha256 = self._download_single(self.download_url, archive, on_chunk, on_restart)
+                    
+                    if expected_sha256 and sha256 != expected_sha256:
+                        raise IOError(f"Checksum mismatch (expected {expected_sha256}, got {sha256})")
+                    
+                    self.logger.info("Download complete. Extracting...")
+                    
+                    if progress_callback:
+                        progress_callback(85, "Extracting FFmpeg...")
+                    
+                    # Extract ffmpeg from the archive based on OS structure
+                    system = platform.system()
+                    archive.seek(0)
+                    if self.download_url.endswith('.tar.xz'):
+                        # Linux builds are tarballs: decompress in one streaming pass
+                        with tarfile.open(fileobj=archive, mode='r|xz') as tar_ref:
+                            targets = {'ffmpeg': self.ffmpeg_path, 'ffprobe': self.ffprobe_path}
+                            for member in tar_ref:
+                                target_path = targets.get(Path(member.name).name)
+                                if member.isfile() and Path(member.name).parent.name == 'bin' and target_path:
+                                    self._extract_member(tar_ref.extractfile(member), target_path)
                     else:
-                        # Fallback or Linux zip handling (if zip)
-                        for file_info in zip_ref.filelist:
-                            if file_info.filename.endswith('ffmpeg'):
-                                with zip_ref.open(file_info) as source:
-                                    with open(self.ffmpeg_path, 'wb') as target:
-                                        target.write(source.read())
-                                os.chmod(self.ffmpeg_path, os.stat(self.ffmpeg_path).st_mode | stat.S_IEXEC)
-                                break
-                
-                # Clean up zip file
-                zip_path.unlink()
+                        with zipfile.ZipFile(archive, 'r') as zip_ref:
+                            names = zip_ref.namelist()
+                            if system == 'Windows':
+                                # ffmpeg.exe and ffprobe.exe live in the build's bin/ folder
+                                wanted = {
+                                    name: self.ffmpeg_dir / Path(name).name
+                                    for name in names if name.endswith(('bin/ffmpeg.exe', 'bin/ffprobe.exe'))
+                                }
+                            elif system == 'Darwin':
+                                # Evermeet zip usually contains just 'ffmpeg' at the root
+                                name = 'ffmpeg' if 'ffmpeg' in names else next((n for n in names if n.endswith('/ffmpeg')), None)
+                                wanted = {name: self.ffmpeg_path} if name else {}
+                            else:
+                                # Fallback or Linux zip handling (if zip)
+                                name = next((n for n in names if n.endswith('ffmpeg')), None)
+                                wanted = {name: self.ffmpeg_path} if name else {}
+                            
+                            # getinfo() is a dictionary lookup, so each member is found without rescanning
+                            for name, target_path in wanted.items():
+                                with zip_ref.open(zip_ref.getinfo(name)) as source:
+                                    self._extract_member(source, target_path)
+                
+                # Only report success if the archive actually contained the binary
+                FFmpegManager._installed = self.ffmpeg_path.exists()
+                if not FFmpegManager._installed:
+                    raise FileNotFoundError("ffmpeg executable not found in the downloaded archive")
                 
                 self.logger.info(f"FFmpeg installed successfully at {self.ffmpeg_path}")
                 
@@ -193,6 +427,183 @@ class FFmpegManager:
         thread = Thread(target=_download, daemon=True)
         thread.start()
     
+    def _extract_member(self, source, target_path):
+        """
+        Copy an archive member to disk and make it executable
+        
+        Args:
+            source: Readable binary stream of the member
+            target_path: Destination path
+        """
+        with open(target_path, 'wb') as target:
+            shutil.copyfileobj(source, target, length=_CHUNK_SIZE)
+        
+        if os.name != 'nt':
+            os.chmod(target_path, os.stat(target_path).st_mode | stat.S_IEXEC)
+    
+    def _fetch_checksum(self):
+        """
+        Get the published SHA-256 of the FFmpeg archive
+        
+        Returns:
+            str: Lowercase hex digest, or None if no checksum is available
+        """
+        import requests
+        
+        if not self.checksum_url:
+            return None
+        
+        archive_name = self.download_url.rsplit('/', 1)[-1]
+        try:
+            response = _get_session().get(self.checksum_url, timeout=30)
+            response.raise_for_status()
+            # One "<sha256>  <filename>" line per release asset
+            for line in response.text.splitlines():
+                parts = line.split()
+                if len(parts) == 2 and parts[1].lstrip('*') == archive_name:
+                    return parts[0].lower()
+            self.logger.warning(f"No checksum published for {archive_name}")
+        except requests.RequestException as e:
+            self.logger.warning(f"Could not fetch FFmpeg checksums: {e}")
+        return None
+    
+    def _hash_file(self, f):
+        """Compute the SHA-256 hex digest of a binary file object"""
+        f.seek(0)
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: hashes in C without a Python-level read loop
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        
+        sha256 = hashlib.sha256()
+        while chunk := f.read(_CHUNK_SIZE):
+            sha256.update(chunk)
+        return sha256.hexdigest()
+    
+    def _download_parallel(self, url, total_size, f, on_chunk):
+        """
+        Download a file with several concurrent HTTP range requests
+        
+        Args:
+            url: File URL (server must support byte ranges)
+            total_size: File size in bytes
+            f: Writable, seekable binary file object to download into
+            on_chunk: Function called with the size of each received chunk
+        """
+        part_size = -(-total_size // _DOWNLOAD_PARTS)  # Ceiling division
+        ranges = [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ]
+        
+        # Each range is written at its own offset; seek + write must not interleave
+        write_lock = Lock()
+        
+        def write_at(offset, data):
+            with write_lock:
+                f.seek(offset)
+                f.write(data)
+        
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(self._download_range, url, start, end, write_at, on_chunk)
+                for start, end in ranges
+            ]
+            for future in futures:
+                future.result()
+    
+    def _download_range(self, url, start, end, write_at, on_chunk):
+        """
+        Download bytes start..end (inclusive) of a file
+        
+        Args:
+            url: File URL
+            start: First byte offset
+            end: Last byte offset
+            write_at: Function called with (offset, data) to store each chunk
+            on_chunk: Function called with the size of each received chunk
+        """
+        session = _get_session()
+        
+        offset = start
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                # Resume from the first byte not yet received
+                response = session.get(
+                    url, headers={'Range': f'bytes={offset}-{end}'}, stream=True, timeout=_REQUEST_TIMEOUT
+                )
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise IOError(f"Server ignored range request (HTTP {response.status_code})")
+                
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                    if chunk:
+                        write_at(offset, chunk)
+                        offset += len(chunk)
+                        on_chunk(len(chunk))
+                return
+            except _retry_errors() as e:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                self.logger.warning(f"Download of bytes {offset}-{end} interrupted ({e}), retrying...")
+                time.sleep(2 ** attempt)
+    
+    def _download_single(self, url, f, on_chunk, on_restart=None):
+        """
+        Download a file over a single connection
+        
+        Args:
+            url: File URL
+            f: Writable, seekable binary file object to download into
+            on_chunk: Function called with the size of each received chunk
+            on_restart: Optional function called when the download starts over from byte 0,
+                so progress already reported through on_chunk can be reset
+            
+        Returns:
+            str: SHA-256 hex digest of the file, computed while downloading
+        """
+        session = _get_session()
+        
+        reported = 0  # Bytes already passed to on_chunk
+        sha256 = hashlib.sha256()
+        
+        for attempt in range(_MAX_ATTEMPTS):
+            # Resume from whatever a previous attempt already wrote
+            existing = f.seek(0, os.SEEK_END)
+            headers = {'Range': f'bytes={existing}-'} if existing else {}
+            
+            try:
+                response = session.get(url, headers=headers, stream=True, timeout=_REQUEST_TIMEOUT)
+                if response.status_code == 416:
+                    # Requested range starts at the end: the file is already complete
+                    return sha256.hexdigest()
+                response.raise_for_status()
+                
+                if response.status_code == 206:
+                    if existing > reported:
+                        on_chunk(existing - reported)
+                        reported = existing
+                else:
+                    # Server ignored the range: start over
+                    f.seek(0)
+                    f.truncate()
+                    sha256 = hashlib.sha256()
+                    if reported and on_restart:
+                        on_restart()
+                    reported = 0
+                
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        sha256.update(chunk)
+                        reported += len(chunk)
+                        on_chunk(len(chunk))
+                return sha256.hexdigest()
+            except _retry_errors() as e:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                self.logger.warning(f"Download interrupted ({e}), resuming...")
+                time.sleep(2 ** attempt)
+    
     def uninstall(self):
         """
         Uninstall FFmpeg by removing the executable and directory
@@ -204,10 +615,12 @@ class FFmpegManager:
             if not self.is_installed():
                 return (False, "FFmpeg is not installed")
             
-            # Remove FFmpeg executable
-            if self.ffmpeg_path.exists():
-                self.ffmpeg_path.unlink()
-                self.logger.info(f"Removed FFmpeg executable: {self.ffmpeg_path}")
+            # Remove FFmpeg executables
+            for path in (self.ffmpeg_path, self.ffprobe_path):
+                if path.exists():
+                    path.unlink()
+                    self.logger.info(f"Removed FFmpeg executable: {path}")
+            FFmpegManager._installed = False
             
             # Remove directory if empty
             if self.ffmpeg_dir.exists() and not any(self.ffmpeg_dir.iterdir()):
@@ -231,6 +644,8 @@ class FFmpegManager:
         try:
             if self.ffmpeg_path.exists():
                 size_bytes = self.ffmpeg_path.stat().st_size
+                if self.ffprobe_path.exists():
+                    size_bytes += self.ffprobe_path.stat().st_size
                 return size_bytes / (1024 * 1024)  # Convert to MB
             return 0
         except Exception:
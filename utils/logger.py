@@ -2,8 +2,11 @@
 Logger utility for VideoSynthesis
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from pathlib import Path
 from datetime import datetime
 
@@ -24,12 +27,30 @@ def setup_logger():
     logger = logging.getLogger('VideoSynthesis')
     logger.setLevel(logging.DEBUG)
     
-    # Clear existing handlers
+    # Clear existing handlers and stop a previous listener
     logger.handlers.clear()
+    previous_listener = getattr(logger, '_listener', None)
+    if previous_listener:
+        previous_listener.stop()
     
-    # File handler
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    # File handler (rotated at 5 MB, opened on first write)
+    rotating_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=5 * 1024 * 1024,
+        backupCount=3,
+        delay=True,
+        encoding='utf-8'
+    )
+    rotating_handler.setLevel(logging.DEBUG)
+    
+    # Buffer records and write them in batches; errors are written immediately
+    file_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=rotating_handler
+    )
     file_handler.setLevel(logging.DEBUG)
+    atexit.register(file_handler.flush)
     
     # Console handler (for development)
     console_handler = logging.StreamHandler()
@@ -41,11 +62,24 @@ def setup_logger():
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    file_handler.setFormatter(formatter)
+    rotating_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Write records on a background thread. QueueHandler still formats the message on the
+    # calling thread (so later changes to its arguments cannot alter it); disk and console
+    # I/O happen on the listener thread.
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        file_handler,
+        console_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    logger._listener = listener
+    atexit.register(listener.stop)
     
     logger.info(f"Logger initialized. Log file: {log_file}")
     
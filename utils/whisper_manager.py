@@ -3,15 +3,89 @@ Whisper Manager - Download and manage Whisper models
 """
 
 import os
-import whisper
+import sys
 import ssl
+import hashlib
 import certifi
 import platform
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from threading import Thread
+from threading import Thread, Lock
+
+
+# Bytes per read when downloading a model
+_CHUNK_SIZE = 1024 * 1024
+
+# Minimum seconds between download progress reports
+_PROGRESS_INTERVAL = 0.1
+
+# fallocate() flag that reserves space without changing the file size (linux/falloc.h)
+_FALLOC_FL_KEEP_SIZE = 0x01
+
+# Seconds the cached model directory state is trusted before it is rescanned
+_STATE_TTL = 1.0
+
+
+def _preallocate(f, offset, length):
+    """
+    Reserve disk space for the rest of a download so the file is laid out contiguously
+    
+    Uses Linux fallocate() with FALLOC_FL_KEEP_SIZE: the file size stays at the bytes
+    actually written, which is what resuming relies on. os.posix_fallocate (and
+    SetEndOfFile on Windows) would grow the file instead, so other platforms are skipped.
+    Failures (e.g. unsupported filesystem) are ignored.
+    """
+    if not sys.platform.startswith('linux') or length <= 0:
+        return
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+        libc.fallocate(f.fileno(), _FALLOC_FL_KEEP_SIZE, offset, length)
+    except (OSError, AttributeError):
+        pass
+
+
+def _empty_cuda_cache():
+    """Return cached GPU memory of released models to the driver (no-op without CUDA)"""
+    try:
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except ImportError:
+        pass
 
 
 class WhisperManager:
+    # Model directory state shared by all instances (they manage the same model files):
+    # the scan_state() tuple, the time it was checked and the directory mtime it was
+    # scanned at. None means "scan again"; reset by download() and uninstall().
+    _state = None
+    _state_at = 0.0
+    _state_mtime = None
+    
+    # whisper module, imported on first use (it pulls in torch, which is slow to import)
+    _whisper = None
+    
+    # Held while a model downloads, so downloads run one at a time
+    _download_lock = Lock()
+    
+    # HTTP session reused by all model downloads (keeps connections alive), created on first use
+    _session = None
+    
+    # Models loaded in this process, shared so uninstall() on any instance releases them:
+    # {model_name: model}. Only the most recently loaded model is kept.
+    _loaded_models = {}
+    _models_lock = Lock()
+    
+    # Loads in progress ({model_name: Future}) and the unload_model() call count, both
+    # guarded by _models_lock; _load_lock runs the loads themselves one at a time
+    _loading = {}
+    _generation = 0
+    _load_lock = Lock()
+    
     def __init__(self, logger):
         self.logger = logger
         
@@ -24,8 +98,15 @@ class WhisperManager:
             os.environ['SSL_CERT_FILE'] = certifi.where()
             os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
         
+        self._prewarm_future = None
+        
+        # Futures of downloads started by this manager and not yet finished
+        self._download_futures = weakref.WeakSet()
+        
         # Whisper cache directory (default: ~/.cache/whisper)
         self.cache_dir = Path.home() / ".cache" / "whisper"
+        self.cache_dir_str = str(self.cache_dir)  # For os and whisper calls on hot paths
+        os.makedirs(self.cache_dir_str, exist_ok=True)
         
         # Available models
         self.models = {
@@ -34,57 +115,115 @@ class WhisperManager:
             'large': {'size': '3 GB', 'file': 'large-v3.pt'}  # Whisper v3
         }
     
-    def is_installed(self, model_name='base'):
-        """Check if a specific Whisper model is installed"""
-        if model_name not in self.models:
-            return False
+    def scan_state(self):
+        """
+        Get installed models and disk usage from one scan of the cache directory
         
-        model_file = self.models[model_name]['file']
-        model_path = self.cache_dir / model_file
+        The result is cached for a second, so repeated UI queries share one scan. After
+        that, the directory is only rescanned if its mtime changed (a file was added,
+        removed or renamed).
         
-        installed = model_path.exists()
-        self.logger.debug(f"Whisper model '{model_name}' installed: {installed}")
+        Returns:
+            tuple: (installed model names: set, total bytes of .pt files: int, number of .pt files: int)
+        """
+        now = time.monotonic()
+        if WhisperManager._state is None or now - WhisperManager._state_at > _STATE_TTL:
+            try:
+                mtime = os.stat(self.cache_dir_str).st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
+            
+            if WhisperManager._state is not None and mtime is not None and mtime == WhisperManager._state_mtime:
+                WhisperManager._state_at = now
+                return WhisperManager._state
+            
+            files = self._model_files()
+            names = {entry.name for entry in files}
+            installed = {name for name in self.models if self._model_file(name) in names}
+            total_bytes = sum(entry.stat().st_size for entry in files)
+            
+            WhisperManager._state = (installed, total_bytes, len(files))
+            WhisperManager._state_at = now
+            WhisperManager._state_mtime = mtime
+        
+        return WhisperManager._state
+    
+    def _model_file(self, model_name):
+        """
+        Get the checkpoint file name of a model
+        
+        Once whisper is imported its own URL table is used, so a renamed checkpoint
+        (e.g. a new 'large' version) is still recognized. Before that the static
+        table is used, so install checks never import whisper and torch.
+        """
+        url = getattr(WhisperManager._whisper, '_MODELS', {}).get(model_name)
+        return os.path.basename(url) if url else self.models[model_name]['file']
+    
+    def is_installed(self, model_name='base'):
+        """Check if a specific Whisper model is installed"""
+        installed = model_name in self.scan_state()[0]
+        self.logger.debug("Whisper model '%s' installed: %s", model_name, installed)
         return installed
     
+    def _get_whisper(self):
+        """Import the whisper module on first use"""
+        if WhisperManager._whisper is None:
+            import whisper
+            WhisperManager._whisper = whisper
+            WhisperManager._state = None  # File names may differ from the static table
+        return WhisperManager._whisper
+    
     def get_installed_model(self):
         """Get the first installed model, or None"""
-        for model_name in ['base', 'medium', 'large']:
-            if self.is_installed(model_name):
-                return model_name
-        return None
+        installed = self.scan_state()[0]
+        return next((name for name in ('base', 'medium', 'large') if name in installed), None)
     
     def download(self, model_name='base', progress_callback=None, completion_callback=None):
         """
         Download a Whisper model in a separate thread
         
+        Downloads are queued and run one at a time.
+        
         Args:
             model_name: 'base', 'medium', or 'large'
             progress_callback: Function to call with progress (percentage, status_message)
             completion_callback: Function to call when complete (success, message)
+            
+        Returns:
+            Future: Resolves when the download ends; cancel() works while it is still queued
         """
+        future = Future()
+        
         if model_name not in self.models:
             if completion_callback:
                 completion_callback(False, f"Invalid model: {model_name}")
-            return
+            future.set_result(False)
+            return future
         
         def _download():
             try:
-                self.logger.info(f"Starting Whisper '{model_name}' model download")
+                self.logger.info("Starting Whisper '%s' model download", model_name)
                 
                 if progress_callback:
                     progress_callback(0, f"Downloading Whisper {model_name} model...")
                 
-                # This will automatically download the model to cache
-                # Whisper handles the download internally
-                model = whisper.load_model(model_name, download_root=str(self.cache_dir))
+                # Fetch the checkpoint file directly; loading the model just to download it
+                # would also deserialize it into memory and report no byte progress
+                url = getattr(self._get_whisper(), '_MODELS', {}).get(model_name)
+                if url:
+                    self._download_file(model_name, url, progress_callback)
+                else:
+                    self._get_whisper().load_model(model_name, download_root=self.cache_dir_str)
                 
-                self.logger.info(f"Whisper '{model_name}' model downloaded successfully")
+                WhisperManager._state = None
+                self.logger.info("Whisper '%s' model downloaded successfully", model_name)
                 
                 if progress_callback:
                     progress_callback(100, f"Whisper {model_name} model installed!")
                 
                 if completion_callback:
                     completion_callback(True, f"Whisper {model_name} model installed successfully!")
+                return True
                     
             except Exception as e:
                 error_msg = f"Failed to download Whisper model: {str(e)}"
@@ -92,10 +231,105 @@ class WhisperManager:
                 
                 if completion_callback:
                     completion_callback(False, error_msg)
+                return False
         
-        # Start download in separate thread
-        thread = Thread(target=_download, daemon=True)
+        def _run():
+            with WhisperManager._download_lock:
+                if not future.set_running_or_notify_cancel():
+                    self.logger.info("Whisper '%s' download cancelled", model_name)
+                    if completion_callback:
+                        completion_callback(False, "Download cancelled")
+                    return
+                future.set_result(_download())
+        
+        # A daemon thread (rather than a thread pool) so closing the app never waits for a download
+        self._download_futures.add(future)
+        thread = Thread(target=_run, daemon=True)
         thread.start()
+        return future
+    
+    def _get_session(self):
+        """Get the shared requests session for model downloads (called under _download_lock)"""
+        if WhisperManager._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            adapter = HTTPAdapter(
+                pool_connections=2,
+                pool_maxsize=4,
+                max_retries=Retry(total=3, backoff_factor=0.5)
+            )
+            session = requests.Session()
+            session.mount('https://', adapter)
+            WhisperManager._session = session
+        return WhisperManager._session
+    
+    def _download_file(self, model_name, url, progress_callback=None):
+        """
+        Download a model checkpoint, resuming a previous partial download
+        
+        Args:
+            model_name: Model name (for progress messages)
+            url: Checkpoint URL from whisper._MODELS (its second-to-last path part is the SHA-256)
+            progress_callback: Function to call with progress (percentage, status_message)
+        """
+        expected_sha256 = url.split('/')[-2]
+        target_path = self.cache_dir / os.path.basename(url)
+        part_path = target_path.with_name(target_path.name + '.part')
+        
+        # Hash what an earlier attempt already wrote so the final checksum covers the whole file
+        sha256 = hashlib.sha256()
+        existing = part_path.stat().st_size if part_path.exists() else 0
+        if existing:
+            with open(part_path, 'rb') as f:
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: hashes in C without a Python-level read loop
+                    sha256 = hashlib.file_digest(f, 'sha256')
+                else:
+                    while chunk := f.read(_CHUNK_SIZE):
+                        sha256.update(chunk)
+        
+        headers = {'Range': f'bytes={existing}-'} if existing else {}
+        with self._get_session().get(url, headers=headers, stream=True, timeout=(5, 60)) as response:
+            if response.status_code == 416:
+                # Requested range starts at the end: the part file is already complete
+                pass
+            else:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    # Server ignored the range: start over
+                    existing = 0
+                    sha256 = hashlib.sha256()
+                
+                total_size = existing + int(response.headers.get('content-length', 0))
+                total_mb = total_size // 1024 // 1024
+                done = existing
+                last_report = 0.0
+                
+                with open(part_path, 'ab' if existing else 'wb') as f:
+                    _preallocate(f, existing, total_size - existing)
+                    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                        f.write(chunk)
+                        sha256.update(chunk)
+                        done += len(chunk)
+                        
+                        now = time.monotonic()
+                        if progress_callback and total_size > 0 and now - last_report >= _PROGRESS_INTERVAL:
+                            last_report = now
+                            percent = int(done / total_size * 99)  # 100 is reported once installed
+                            progress_callback(percent, f"Downloading Whisper {model_name}... {done // 1024 // 1024}MB / {total_mb}MB")
+        
+        if sha256.hexdigest() != expected_sha256:
+            part_path.unlink()
+            raise IOError(f"Checksum mismatch for {target_path.name}, please retry the download")
+        
+        os.replace(part_path, target_path)
+    
+    def cancel_downloads(self):
+        """Cancel downloads that are still waiting for an earlier one to finish"""
+        for future in list(self._download_futures):
+            future.cancel()
     
     def uninstall(self):
         """
@@ -105,20 +339,26 @@ class WhisperManager:
             tuple: (success: bool, message: str, models_removed: list)
         """
         try:
-            if not self.cache_dir.exists():
-                return (False, "No Whisper models found", [])
-            
             models_removed = []
             
-            # Remove all .pt model files
-            for model_file in self.cache_dir.glob("*.pt"):
-                try:
-                    model_name = model_file.stem
-                    model_file.unlink()
-                    models_removed.append(model_name)
-                    self.logger.info(f"Removed Whisper model: {model_name}")
-                except Exception as e:
-                    self.logger.error(f"Failed to remove {model_file}: {str(e)}")
+            # Release models loaded from the files about to be removed
+            self.unload_model()
+            
+            # Remove all .pt model files (in parallel: unlinking multi-GB files can take a while)
+            model_files = self._model_files()
+            if model_files:
+                with ThreadPoolExecutor(max_workers=min(8, len(model_files))) as executor:
+                    futures = {executor.submit(os.unlink, entry.path): entry for entry in model_files}
+                    for future, entry in futures.items():
+                        try:
+                            future.result()
+                            model_name = Path(entry.name).stem
+                            models_removed.append(model_name)
+                            self.logger.info("Removed Whisper model: %s", model_name)
+                        except Exception as e:
+                            self.logger.error("Failed to remove %s: %s", entry.path, e)
+            
+            WhisperManager._state = None
             
             if models_removed:
                 return (True, f"Removed {len(models_removed)} Whisper model(s)", models_removed)
@@ -138,23 +378,180 @@ class WhisperManager:
             float: Total size in MB, or 0 if no models installed
         """
         try:
-            if not self.cache_dir.exists():
-                return 0
-            
-            total_size = 0
-            for model_file in self.cache_dir.glob("*.pt"):
-                total_size += model_file.stat().st_size
-            
-            return total_size / (1024 * 1024)  # Convert to MB
+            return self.scan_state()[1] / (1024 * 1024)  # Convert to MB
         except Exception:
             return 0
     
+    def _model_files(self):
+        """
+        List the .pt model files in the cache directory with a single scan
+        
+        Returns:
+            list: os.DirEntry objects (each caches its own stat() result)
+        """
+        try:
+            with os.scandir(self.cache_dir_str) as entries:
+                return [
+                    entry for entry in entries
+                    if entry.name.endswith('.pt') and entry.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            return []
+    
     def load_model(self, model_name='base'):
-        """Load a Whisper model for transcription"""
+        """Load a Whisper model for transcription (reused across calls)"""
+        with WhisperManager._models_lock:
+            if model_name in WhisperManager._loaded_models:
+                return WhisperManager._loaded_models[model_name]
+            
+            # Another thread is already loading this model: wait for it instead of loading twice
+            future = WhisperManager._loading.get(model_name)
+            if future is None:
+                future = Future()
+                WhisperManager._loading[model_name] = future
+                loading = True
+            else:
+                loading = False
+        
+        if not loading:
+            return future.result()
+        
         try:
-            self.logger.info(f"Loading Whisper model: {model_name}")
-            model = whisper.load_model(model_name, download_root=str(self.cache_dir))
-            return model
+            # _models_lock is not held while loading, so unload_model() never waits on a load
+            with WhisperManager._load_lock:
+                with WhisperManager._models_lock:
+                    # Release other models first so two large models are never resident at once
+                    evicted = list(WhisperManager._loaded_models)
+                    WhisperManager._loaded_models.clear()
+                    generation = WhisperManager._generation
+                
+                if evicted:
+                    self.logger.info("Unloaded Whisper model(s): %s", ', '.join(evicted))
+                    _empty_cuda_cache()
+                
+                self.logger.info("Loading Whisper model: %s", model_name)
+                model = self._to_inference_device(self._load_checkpoint(model_name))
         except Exception as e:
-            self.logger.error(f"Failed to load Whisper model: {str(e)}")
+            self.logger.error("Failed to load Whisper model: %s", e)
+            with WhisperManager._models_lock:
+                del WhisperManager._loading[model_name]
+            future.set_exception(e)
             raise
+        
+        with WhisperManager._models_lock:
+            del WhisperManager._loading[model_name]
+            # Not cached if unload_model() ran meanwhile (e.g. the model files were uninstalled)
+            if generation == WhisperManager._generation:
+                WhisperManager._loaded_models[model_name] = model
+        future.set_result(model)
+        return model
+    
+    def _load_checkpoint(self, model_name):
+        """
+        Build a Whisper model on the CPU from its checkpoint file, memory-mapped instead of read into memory
+        
+        Falls back to whisper.load_model for unknown or missing checkpoints, and for
+        torch versions that cannot memory-map them.
+        """
+        whisper = self._get_whisper()
+        url = getattr(whisper, '_MODELS', {}).get(model_name)
+        checkpoint_path = os.path.join(self.cache_dir_str, os.path.basename(url)) if url else None
+        if not checkpoint_path or not os.path.isfile(checkpoint_path):
+            return whisper.load_model(model_name, device='cpu', download_root=self.cache_dir_str)
+        
+        import torch
+        try:
+            # Tensors are paged in from the file, so the checkpoint never needs its own copy in RAM
+            checkpoint = torch.load(checkpoint_path, map_location='cpu', mmap=True, weights_only=True)
+        except (TypeError, RuntimeError) as e:
+            # torch < 2.1 has no mmap argument; legacy (non-zip) checkpoints cannot be mapped
+            self.logger.debug("Memory-mapped load unavailable (%s), using whisper.load_model", e)
+            return whisper.load_model(model_name, device='cpu', download_root=self.cache_dir_str)
+        
+        # Same steps as whisper.load_model, minus its full re-hash of the checkpoint file
+        model = whisper.model.Whisper(whisper.model.ModelDimensions(**checkpoint['dims']))
+        model.load_state_dict(checkpoint['model_state_dict'])
+        del checkpoint
+        
+        alignment_heads = getattr(whisper, '_ALIGNMENT_HEADS', {}).get(model_name)
+        if alignment_heads is not None:
+            model.set_alignment_heads(alignment_heads)
+        
+        return model
+    
+    def _to_inference_device(self, model):
+        """
+        Move a CPU model to the GPU in FP16, the precision transcribe() runs in there
+        
+        Converting before the move means the GPU never holds an FP32 copy of the weights,
+        and makes whisper's per-layer weight casts no-ops. LayerNorms stay in FP32 because
+        whisper always feeds them FP32 input. Without CUDA the model stays on the CPU in
+        FP32, which transcribe() uses there.
+        """
+        import torch
+        
+        if not torch.cuda.is_available():
+            return model
+        
+        model.half()
+        for module in model.modules():
+            if isinstance(module, torch.nn.LayerNorm):
+                module.float()
+        model = model.to("cuda")
+        _empty_cuda_cache()
+        return model
+    
+    def prewarm(self, model_name=None):
+        """
+        Load a model in the background so the first transcription starts sooner
+        
+        A load_model() call made meanwhile waits for this load instead of starting another.
+        
+        Args:
+            model_name: Model to load, or None for the installed model
+            
+        Returns:
+            Future: Resolves to the loaded model, or None if there is nothing to load
+        """
+        model_name = model_name or self.get_installed_model()
+        if model_name is None or model_name in WhisperManager._loaded_models:
+            return None
+        
+        if self._prewarm_future and not self._prewarm_future.done():
+            return self._prewarm_future
+        
+        future = Future()
+        
+        def _run():
+            try:
+                future.set_result(self.load_model(model_name))
+            except Exception as e:
+                future.set_exception(e)
+        
+        self._prewarm_future = future
+        thread = Thread(target=_run, daemon=True)
+        thread.start()
+        return future
+    
+    def unload_model(self, model_name=None):
+        """
+        Release loaded Whisper models and free cached GPU memory
+        
+        Args:
+            model_name: Model to release, or None to release all loaded models
+        """
+        with WhisperManager._models_lock:
+            WhisperManager._generation += 1
+            if model_name is None:
+                released = list(WhisperManager._loaded_models)
+                WhisperManager._loaded_models.clear()
+            elif WhisperManager._loaded_models.pop(model_name, None) is not None:
+                released = [model_name]
+            else:
+                released = []
+        
+        if not released:
+            return
+        
+        self.logger.info("Unloaded Whisper model(s): %s", ', '.join(released))
+        _empty_cuda_cache()